@@ -4,16 +4,26 @@ Data Service for Dashboard
 This module provides functions to fetch and process data for the dashboard.
 Supports multiple sentiment model types: synthetic, twitter, hybrid, and domain-aware.
 """
-import os
-import sys
+import copy
+import atexit
+import asyncio
+import functools
 import logging
+import threading
+import time
+import weakref
+import httpx
+import orjson
 import requests
 import json
-import pandas as pd
+from calendar import monthrange
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-
-# Add the project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# pandas and numpy are imported inside the DataFrame functions so callers
+# that only need predictions do not pay their import cost
 
 from app.data.database import get_incidents, get_sentiment_stats
 from app.utils.config import MOCK_API_URL, MODEL_API_URL
@@ -25,6 +35,131 @@ logging.basicConfig(
 )
 logger = logging.getLogger('data_service')
 
+# Model API endpoints, derived once from the /predict URL
+_MODEL_BASE = MODEL_API_URL[:-len("/predict")] if MODEL_API_URL.endswith("/predict") else MODEL_API_URL
+_MODELS_URL = f"{_MODEL_BASE}/models"
+_COMPARE_URL = f"{_MODEL_BASE}/compare"
+_BATCH_URL = f"{_MODEL_BASE}/batch_predict"
+
+# Shared HTTP session so repeated API calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+
+def _decode_json(response):
+    """
+    Decode a JSON response body with orjson.
+    
+    Args:
+        response (requests.Response): API response
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        requests.exceptions.InvalidJSONError: If the body is not valid JSON
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(f"Invalid JSON in response: {str(e)}", response=response)
+
+def _new_async_client():
+    """
+    Create an HTTP/2 capable async client with a bounded connection pool.
+    
+    Returns:
+        httpx.AsyncClient: Async HTTP client
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=30.0
+    )
+
+
+# Shared async clients for callers that already run inside an event loop.
+# Pooled connections are bound to the loop that opened them, so there is one
+# client per loop. Each client is tied to an async generator registered with
+# its loop; loop.shutdown_asyncgens(), which asyncio.run calls before closing
+# the loop, closes the generator and with it the client.
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+
+async def _async_client_lifetime(client):
+    """Keep an async client open until its event loop shuts down."""
+    try:
+        yield
+    finally:
+        loop = asyncio.get_running_loop()
+        with _ASYNC_CLIENTS_LOCK:
+            _ASYNC_CLIENTS.pop(loop, None)
+        await client.aclose()
+
+async def _get_async_client():
+    """
+    Get the shared async client for the running event loop.
+    
+    Returns:
+        httpx.AsyncClient: Async HTTP client
+    """
+    loop = asyncio.get_running_loop()
+    with _ASYNC_CLIENTS_LOCK:
+        entry = _ASYNC_CLIENTS.get(loop)
+        is_new = entry is None
+        if is_new:
+            client = _new_async_client()
+            entry = (client, _async_client_lifetime(client))
+            _ASYNC_CLIENTS[loop] = entry
+    client, lifetime = entry
+    if is_new:
+        # Start the generator so the loop tracks it for shutdown
+        await lifetime.asend(None)
+    return client
+
+def _close_async_client():
+    """Close async clients whose loops were not shut down before process exit."""
+    with _ASYNC_CLIENTS_LOCK:
+        entries = list(_ASYNC_CLIENTS.items())
+    for loop, (_, lifetime) in entries:
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(lifetime.aclose())
+        except Exception as e:
+            logger.debug(f"Error closing async HTTP client: {str(e)}")
+
+atexit.register(_close_async_client)
+
+# Endpoint serving the domain-aware model (None for hybrid fallback only).
+# A probed route is reused until _DOMAIN_ROUTE_EXPIRES; after connection
+# errors or 5xx responses the probe is retried with exponential backoff.
+_DOMAIN_ROUTE = None
+_DOMAIN_ROUTE_EXPIRES = 0.0
+_DOMAIN_ROUTE_FAILURES = 0
+_DOMAIN_ROUTE_LOCK = threading.Lock()
+_DOMAIN_ROUTE_TTL = 300
+_DOMAIN_ROUTE_BACKOFF = 5
+_DOMAIN_ROUTE_MAX_BACKOFF = 300
+
+# Column dtypes for incident DataFrames. incident_id and report are unique
+# free text, so only the sentiment score is narrowed (nullable for
+# incidents that have not been analyzed yet).
+_INCIDENT_DTYPES = {'sentiment': 'Int8'}
+
+# Fixed sentiment label categories so grouping works on integer codes
+_SENTIMENT_LABELS = ['positive', 'neutral', 'negative', 'not analyzed']
+
+# Short-lived cache of incident DataFrames keyed by query, shared by dashboard renders
+_INCIDENTS_CACHE = TTLCache(maxsize=8, ttl=30)
+_INCIDENTS_CACHE_LOCK = threading.Lock()
+
 def fetch_raw_incidents(count=20):
     """
     Fetch raw incidents from the API.
@@ -36,48 +171,81 @@ def fetch_raw_incidents(count=20):
         list: List of incident dictionaries
     """
     try:
-        response = requests.get(f"{MOCK_API_URL}?count={count}")
+        response = _SESSION.get(f"{MOCK_API_URL}?count={count}")
         response.raise_for_status()
-        incidents = response.json()
+        incidents = _decode_json(response)
         logger.info(f"Fetched {len(incidents)} raw incidents from API")
         return incidents
     except requests.exceptions.RequestException as e:
         logger.error(f"Error fetching incidents from API: {str(e)}")
         return []
 
-def get_incidents_from_db(limit=100):
+def get_incidents_from_db(limit=100, start=None, end=None, order_by='timestamp DESC', include_date=True):
     """
     Get incidents from the database.
     
+    Results are cached for 30 seconds; a copy is returned so callers
+    can modify it freely. Incidents and sentiment are written by the
+    ingestion and model API processes, so the TTL is the only bound on
+    staleness. Empty results are not cached, since the database layer
+    also returns no rows when a query fails.
+    
     Args:
-        limit (int): Maximum number of incidents to retrieve
+        limit (int, optional): Maximum number of incidents to retrieve, None for no limit
+        start (datetime, optional): Only include incidents at or after this time (UTC)
+        end (datetime, optional): Only include incidents before this time (UTC)
+        order_by (str): Row ordering applied by the database, e.g. 'timestamp DESC'
+        include_date (bool): Whether to add the calendar 'date' column
         
     Returns:
         pandas.DataFrame: DataFrame with incident data
     """
+    import pandas as pd
+    
+    cache_key = (limit, start, end, order_by, include_date)
+    with _INCIDENTS_CACHE_LOCK:
+        cached = _INCIDENTS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached.copy()
+    
     try:
-        incidents = get_incidents(limit=limit)
+        incidents = get_incidents(limit=limit, start=start, end=end, order_by=order_by)
         df = pd.DataFrame(incidents)
         
         if not df.empty:
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df['date'] = df['timestamp'].dt.date
+            df = df.astype(_INCIDENT_DTYPES)
             
-            # Map sentiment to string labels
-            sentiment_map = {1: 'positive', 0: 'neutral', -1: 'negative', None: 'not analyzed'}
-            df['sentiment_label'] = df['sentiment'].map(lambda x: sentiment_map.get(x, 'not analyzed'))
+            # Convert timestamp to datetime (stored as ISO 8601 strings, e.g. 2024-01-31T12:00:00Z)
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', utc=True, cache=True)
+            if include_date:
+                df['date'] = df['timestamp'].dt.tz_localize(None).dt.normalize()
             
-            logger.info(f"Retrieved {len(df)} incidents from database")
-        else:
-            logger.warning("No incidents found in database")
+            # Map sentiment to string labels (vectorized, unknown/missing -> 'not analyzed')
+            sentiment_map = {1: 'positive', 0: 'neutral', -1: 'negative'}
+            df['sentiment_label'] = (
+                df['sentiment'].map(sentiment_map).fillna('not analyzed').astype(pd.CategoricalDtype(_SENTIMENT_LABELS))
+            )
             
+            logger.info(f"Retrieved {len(df)} incidents from database")
+            with _INCIDENTS_CACHE_LOCK:
+                _INCIDENTS_CACHE[cache_key] = df
+            return df.copy()
+        
+        logger.warning("No incidents found in database")
         return df
     
     except Exception as e:
         logger.error(f"Error getting incidents from database: {str(e)}")
         return pd.DataFrame()
 
+def invalidate_incidents_cache():
+    """
+    Clear cached incident DataFrames. Call after writing incidents or
+    sentiment from this process.
+    """
+    with _INCIDENTS_CACHE_LOCK:
+        _INCIDENTS_CACHE.clear()
+
 def get_sentiment_statistics():
     """
     Get sentiment statistics from the database.
@@ -101,9 +269,9 @@ def get_available_models():
         list: List of available model types
     """
     try:
-        response = requests.get(f"{MODEL_API_URL.rstrip('/predict')}/models")
+        response = _SESSION.get(_MODELS_URL)
         response.raise_for_status()
-        result = response.json()
+        result = _decode_json(response)
         models = result.get('models', [])
         
         # Ensure domain-aware model is included in the list
@@ -117,10 +285,225 @@ def get_available_models():
         # Default to synthetic and domain-aware models if can't get list
         return ["synthetic", "domain_aware"]
 
+def _is_transient_error(error):
+    """
+    Check whether a failed API request may succeed if retried later.
+    
+    Connection problems, timeouts, invalid bodies and 5xx responses are
+    transient; 4xx responses are answers from a reachable server.
+    
+    Args:
+        error (Exception): requests or httpx exception
+        
+    Returns:
+        bool: True if the error is transient
+    """
+    if isinstance(error, (requests.exceptions.HTTPError, httpx.HTTPStatusError)):
+        response = getattr(error, 'response', None)
+        if response is not None:
+            return response.status_code >= 500
+    return True
+
+def _probe_domain_route():
+    """
+    Find which model API endpoint serves the domain-aware model.
+    
+    The /models listing is authoritative: the API only lists domain_aware
+    when the model is loaded, and its /domain_predict route returns 404
+    otherwise.
+    
+    Returns:
+        str: Endpoint URL, or None if the domain-aware model is unavailable
+        
+    Raises:
+        requests.exceptions.RequestException: If the server could not be probed
+    """
+    try:
+        response = _SESSION.get(_MODELS_URL)
+        response.raise_for_status()
+        models = _decode_json(response).get('models', [])
+    except requests.exceptions.RequestException as e:
+        if _is_transient_error(e):
+            raise
+        # The server answered but has no model listing, so only hybrid is usable
+        logger.warning(f"Error probing available models: {str(e)}")
+        return None
+    
+    return MODEL_API_URL if "domain_aware" in models else None
+
+def _get_domain_route():
+    """
+    Get the cached domain-aware endpoint, probing the server when it expires.
+    
+    Returns:
+        str: Endpoint URL, or None if the domain-aware model is unavailable
+    """
+    global _DOMAIN_ROUTE, _DOMAIN_ROUTE_EXPIRES, _DOMAIN_ROUTE_FAILURES
+    with _DOMAIN_ROUTE_LOCK:
+        if time.monotonic() >= _DOMAIN_ROUTE_EXPIRES:
+            try:
+                _DOMAIN_ROUTE = _probe_domain_route()
+                _DOMAIN_ROUTE_EXPIRES = time.monotonic() + _DOMAIN_ROUTE_TTL
+                _DOMAIN_ROUTE_FAILURES = 0
+                logger.info(f"Domain-aware model route: {_DOMAIN_ROUTE or 'hybrid fallback'}")
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Error probing available models: {str(e)}")
+                _schedule_domain_reprobe()
+        return _DOMAIN_ROUTE
+
+def _schedule_domain_reprobe():
+    """Use the hybrid fallback and re-probe after a backoff. Caller holds the lock."""
+    global _DOMAIN_ROUTE, _DOMAIN_ROUTE_EXPIRES, _DOMAIN_ROUTE_FAILURES
+    backoff = min(_DOMAIN_ROUTE_BACKOFF * 2 ** _DOMAIN_ROUTE_FAILURES, _DOMAIN_ROUTE_MAX_BACKOFF)
+    _DOMAIN_ROUTE = None
+    _DOMAIN_ROUTE_EXPIRES = time.monotonic() + backoff
+    _DOMAIN_ROUTE_FAILURES += 1
+
+def _record_domain_failure(error):
+    """
+    Update the cached domain-aware route after a failed request.
+    
+    A transient failure schedules a re-probe with backoff; any other
+    failure (e.g. 404 because the model is not loaded) caches that no
+    domain-aware route exists.
+    
+    Args:
+        error (Exception): requests or httpx exception
+    """
+    global _DOMAIN_ROUTE, _DOMAIN_ROUTE_EXPIRES, _DOMAIN_ROUTE_FAILURES
+    with _DOMAIN_ROUTE_LOCK:
+        if _is_transient_error(error):
+            _schedule_domain_reprobe()
+        else:
+            _DOMAIN_ROUTE = None
+            _DOMAIN_ROUTE_EXPIRES = time.monotonic() + _DOMAIN_ROUTE_TTL
+            _DOMAIN_ROUTE_FAILURES = 0
+
+def _invalidate_domain_route():
+    """Forget the cached domain-aware endpoint so the next request re-probes."""
+    global _DOMAIN_ROUTE_EXPIRES, _DOMAIN_ROUTE_FAILURES
+    with _DOMAIN_ROUTE_LOCK:
+        _DOMAIN_ROUTE_EXPIRES = 0.0
+        _DOMAIN_ROUTE_FAILURES = 0
+
+class _DomainAwareUnavailable(Exception):
+    """Raised when no endpoint can serve a domain-aware prediction."""
+
+def _request_hybrid_fallback(text, store_for_feedback=False):
+    """
+    Request a hybrid model prediction in place of an unavailable domain-aware one.
+    
+    Args:
+        text (str): Text to analyze
+        store_for_feedback (bool): Whether to store prediction for feedback
+        
+    Returns:
+        dict: Prediction result tagged as a fallback
+        
+    Raises:
+        requests.exceptions.RequestException: If the API request fails
+    """
+    data = {"text": text, "model_type": "hybrid", "store_for_feedback": store_for_feedback}
+    try:
+        response = _SESSION.post(
+            f"{MODEL_API_URL}",
+            data=orjson.dumps(data)
+        )
+        response.raise_for_status()
+        result = _decode_json(response)
+    except requests.exceptions.RequestException as e:
+        # The server may be down; re-probe once it could be back
+        if _is_transient_error(e):
+            _record_domain_failure(e)
+        raise
+    # Add domain-aware tag so UI knows this was a fallback
+    result["model_type"] = "domain_aware (fallback to hybrid)"
+    logger.info("Received fallback prediction for text using hybrid model: %s", result)
+    return result
+
+def _request_prediction(text, model_type=None, store_for_feedback=False):
+    """
+    Request a sentiment prediction from the model API.
+    
+    Args:
+        text (str): Text to analyze
+        model_type (str, optional): Type of model to use
+        store_for_feedback (bool): Whether to store prediction for feedback
+        
+    Returns:
+        dict: Prediction result
+        
+    Raises:
+        requests.exceptions.RequestException: If the API request fails
+        _DomainAwareUnavailable: If the domain-aware model cannot be reached
+    """
+    data = {"text": text}
+    
+    # Add model_type if specified
+    if model_type:
+        data["model_type"] = model_type
+        
+    # Set store_for_feedback based on parameter
+    data["store_for_feedback"] = store_for_feedback
+    
+    # Log request details
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Sending prediction request with store_for_feedback=%s, model_type=%s",
+            store_for_feedback, model_type
+        )
+        
+    # Handle domain-aware model separately if needed
+    if model_type == "domain_aware":
+        domain_route = _get_domain_route()
+        if domain_route is None:
+            raise _DomainAwareUnavailable("No endpoint serves the domain-aware model")
+        try:
+            # Call the endpoint known to serve the domain-aware model
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Calling domain API at: %s with data: %s", domain_route, data)
+            response = _SESSION.post(
+                domain_route,
+                data=orjson.dumps(data)
+            )
+            response.raise_for_status()
+            result = _decode_json(response)
+        except requests.exceptions.RequestException as e2:
+            logger.warning("Domain-aware model API not available: %s", e2)
+            _record_domain_failure(e2)
+            raise _DomainAwareUnavailable(str(e2)) from e2
+    else:
+        # For other models, use standard API
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calling API at: %s with data: %s", MODEL_API_URL, data)
+        response = _SESSION.post(
+            f"{MODEL_API_URL}",
+            data=orjson.dumps(data)
+        )
+        response.raise_for_status()
+        result = _decode_json(response)
+        
+    logger.info("Received prediction for text using %s model: %s", model_type or 'default', result)
+    return result
+
+@functools.lru_cache(maxsize=4096)
+def _predict_cached(text, model_type=None):
+    """
+    Memoized prediction for requests without feedback side effects.
+    
+    Failed requests and domain-aware requests that need the hybrid
+    fallback raise, so only direct answers are cached.
+    """
+    return _request_prediction(text, model_type, store_for_feedback=False)
+
 def predict_sentiment(text, model_type=None, store_for_feedback=False):
     """
     Get sentiment prediction for a text using the model API.
     
+    Predictions not stored for feedback are deterministic and are served
+    from an in-process cache; call predict_sentiment.cache_clear() after
+    reloading models.
+    
     Args:
         text (str): Text to analyze
         model_type (str, optional): Type of model to use
@@ -130,71 +513,133 @@ def predict_sentiment(text, model_type=None, store_for_feedback=False):
         dict: Prediction result
     """
     try:
-        data = {"text": text}
+        try:
+            if store_for_feedback:
+                return _request_prediction(text, model_type, store_for_feedback=True)
+            # Copy so callers cannot modify the cached result
+            return copy.deepcopy(_predict_cached(text, model_type))
+        except _DomainAwareUnavailable:
+            # Not cached, so the domain-aware answer is used once it recovers
+            return _request_hybrid_fallback(text, store_for_feedback)
+    except requests.exceptions.RequestException as e:
+        logger.error("Error getting prediction: %s", e)
+        return {
+            "sentiment": "neutral",
+            "sentiment_value": 0,
+            "confidence": 0.0,
+            "text": text,
+            "model_type": model_type or "unknown",
+            "error": str(e)
+        }
+
+def _clear_prediction_caches():
+    """Clear memoized predictions and the cached domain-aware route."""
+    _predict_cached.cache_clear()
+    _invalidate_domain_route()
+
+predict_sentiment.cache_clear = _clear_prediction_caches
+
+def compare_models(text):
+    """
+    Compare sentiment predictions from all available models.
+    
+    Args:
+        text (str): Text to analyze
         
-        # Add model_type if specified
+    Returns:
+        dict: Comparison results from all models
+    """
+    try:
+        response = _SESSION.post(
+            _COMPARE_URL,
+            data=orjson.dumps({"text": text})
+        )
+        response.raise_for_status()
+        result = _decode_json(response)
+        logger.info("Received model comparison for text")
+        return result
+    except requests.exceptions.RequestException as e:
+        logger.error("Error comparing models: %s", e)
+        return {
+            "text": text,
+            "models": {},
+            "count": 0,
+            "error": str(e)
+        }
+
+async def _post(url, data, client=None):
+    """
+    POST JSON data to a URL using the async client.
+    
+    Args:
+        url (str): Endpoint URL
+        data (dict): JSON payload
+        client (httpx.AsyncClient, optional): Client to use, defaults to the shared client
+        
+    Returns:
+        dict: Decoded JSON response
+        
+    Raises:
+        httpx.HTTPError: If the request fails or the body is not valid JSON
+    """
+    client = client or await _get_async_client()
+    response = await client.post(
+        url,
+        content=orjson.dumps(data),
+        headers={"Content-Type": "application/json"}
+    )
+    response.raise_for_status()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise httpx.DecodingError(f"Invalid JSON in response: {str(e)}", request=response.request)
+
+async def predict_sentiment_async(text, model_type=None, store_for_feedback=False, client=None):
+    """
+    Async variant of predict_sentiment.
+    
+    Args:
+        text (str): Text to analyze
+        model_type (str, optional): Type of model to use
+        store_for_feedback (bool): Whether to store prediction for feedback
+        client (httpx.AsyncClient, optional): Client to use, defaults to the shared client
+        
+    Returns:
+        dict: Prediction result
+    """
+    try:
+        data = {"text": text}
         if model_type:
             data["model_type"] = model_type
-            
-        # Set store_for_feedback based on parameter
         data["store_for_feedback"] = store_for_feedback
         
-        # Log request details
-        logger.info(f"Sending prediction request with store_for_feedback={store_for_feedback}, model_type={model_type}")
-            
-        # Handle domain-aware model separately if needed
         if model_type == "domain_aware":
-            try:
-                # First try calling the normal API endpoint
-                logger.info(f"Calling API at: {MODEL_API_URL} with data: {data}")
-                response = requests.post(
-                    f"{MODEL_API_URL}",
-                    json=data,
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                result = response.json()
-            except requests.exceptions.RequestException:
-                # If the normal endpoint doesn't support domain-aware model,
-                # try a dedicated endpoint
+            result = None
+            domain_route = await asyncio.to_thread(_get_domain_route)
+            if domain_route is not None:
                 try:
-                    domain_api_url = f"{MODEL_API_URL.rstrip('/predict')}/domain_predict"
-                    logger.info(f"Falling back to domain API at: {domain_api_url}")
-                    response = requests.post(
-                        domain_api_url,
-                        json=data,
-                        headers={"Content-Type": "application/json"}
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                except requests.exceptions.RequestException as e2:
-                    # Fall back to hybrid model
-                    logger.warning(f"Domain-aware model API not available: {str(e2)}")
-                    data["model_type"] = "hybrid"
-                    response = requests.post(
-                        f"{MODEL_API_URL}",
-                        json=data,
-                        headers={"Content-Type": "application/json"}
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                    # Add domain-aware tag so UI knows this was a fallback
-                    result["model_type"] = "domain_aware (fallback to hybrid)"
-        else:
-            # For other models, use standard API
-            logger.info(f"Calling API at: {MODEL_API_URL} with data: {data}")
-            response = requests.post(
-                f"{MODEL_API_URL}",
-                json=data,
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            result = response.json()
+                    result = await _post(domain_route, data, client)
+                except httpx.HTTPError as e2:
+                    logger.warning("Domain-aware model API not available: %s", e2)
+                    _record_domain_failure(e2)
             
-        logger.info(f"Received prediction for text using {model_type or 'default'} model: {result}")
+            if result is None:
+                # Fall back to hybrid model
+                data["model_type"] = "hybrid"
+                try:
+                    result = await _post(MODEL_API_URL, data, client)
+                except httpx.HTTPError as e3:
+                    # The server may be down; re-probe once it could be back
+                    if _is_transient_error(e3):
+                        _record_domain_failure(e3)
+                    raise
+                result["model_type"] = "domain_aware (fallback to hybrid)"
+        else:
+            result = await _post(MODEL_API_URL, data, client)
+        
         return result
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error getting prediction: {str(e)}")
+    except httpx.HTTPError as e:
+        logger.error("Error getting prediction: %s", e)
         return {
             "sentiment": "neutral",
             "sentiment_value": 0,
@@ -204,28 +649,21 @@ def predict_sentiment(text, model_type=None, store_for_feedback=False):
             "error": str(e)
         }
 
-def compare_models(text):
+async def compare_models_async(text, client=None):
     """
-    Compare sentiment predictions from all available models.
+    Async variant of compare_models.
     
     Args:
         text (str): Text to analyze
+        client (httpx.AsyncClient, optional): Client to use, defaults to the shared client
         
     Returns:
         dict: Comparison results from all models
     """
     try:
-        response = requests.post(
-            f"{MODEL_API_URL.rstrip('/predict')}/compare",
-            json={"text": text},
-            headers={"Content-Type": "application/json"}
-        )
-        response.raise_for_status()
-        result = response.json()
-        logger.info(f"Received model comparison for text")
-        return result
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error comparing models: {str(e)}")
+        return await _post(_COMPARE_URL, {"text": text}, client)
+    except httpx.HTTPError as e:
+        logger.error("Error comparing models: %s", e)
         return {
             "text": text,
             "models": {},
@@ -233,6 +671,251 @@ def compare_models(text):
             "error": str(e)
         }
 
+def _run_concurrently(make_call, texts):
+    """
+    Run one async API call per text concurrently and wait for all results.
+    
+    A fresh client is used for each run because asyncio.run creates a new
+    event loop and pooled connections cannot be shared across loops.
+    
+    Args:
+        make_call (callable): Coroutine function taking (text, client)
+        texts (list): Texts to analyze
+        
+    Returns:
+        list: Results in the same order as texts
+    """
+    async def _gather():
+        async with _new_async_client() as client:
+            return await asyncio.gather(*[make_call(t, client) for t in texts])
+    
+    return list(asyncio.run(_gather()))
+
+def predict_sentiment_many(texts, model_type=None, store_for_feedback=False):
+    """
+    Get sentiment predictions for several texts concurrently.
+    
+    Args:
+        texts (list): Texts to analyze
+        model_type (str, optional): Type of model to use
+        store_for_feedback (bool): Whether to store predictions for feedback
+        
+    Returns:
+        list: Prediction results in the same order as texts
+    """
+    return _run_concurrently(
+        lambda t, client: predict_sentiment_async(t, model_type, store_for_feedback, client),
+        texts
+    )
+
+def compare_models_many(texts):
+    """
+    Compare model predictions for several texts concurrently.
+    
+    Args:
+        texts (list): Texts to analyze
+        
+    Returns:
+        list: Comparison results in the same order as texts
+    """
+    return _run_concurrently(
+        lambda t, client: compare_models_async(t, client),
+        texts
+    )
+
+# Models the batch endpoint serves itself; it maps other names to its own
+# default and picks a different default than /predict when none is given
+_BATCH_MODELS = frozenset({"synthetic", "twitter", "hybrid"})
+
+def _batch_payload(texts, model_type):
+    """Build the request body for the batch prediction endpoint."""
+    data = {"texts": list(texts)}
+    if model_type:
+        data["model_type"] = model_type
+    return data
+
+def _unpack_batch_result(result, texts, model_type):
+    """
+    Extract per-text predictions from a batch endpoint response.
+    
+    Raises:
+        ValueError: If the response does not contain one prediction per text
+    """
+    predictions = result.get("predictions", [])
+    if len(predictions) != len(texts):
+        raise ValueError(f"Expected {len(texts)} predictions, got {len(predictions)}")
+    for prediction in predictions:
+        prediction.setdefault("model_type", result.get("model_type", model_type))
+    return predictions
+
+async def predict_sentiment_batch_async(texts, model_type=None, client=None):
+    """
+    Async variant of predict_sentiment_batch.
+    
+    Only synthetic, twitter and hybrid predictions use the batch endpoint;
+    other models and the default fall back to predict_sentiment_async.
+    
+    Args:
+        texts (list): Texts to analyze
+        model_type (str, optional): Type of model to use
+        client (httpx.AsyncClient, optional): Client to use, defaults to the shared client
+        
+    Returns:
+        list: Prediction results in the same order as texts
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    
+    # Other models (and the default) would be answered by a different model, so use single calls
+    if model_type in _BATCH_MODELS:
+        try:
+            result = await _post(_BATCH_URL, _batch_payload(texts, model_type), client)
+            return _unpack_batch_result(result, texts, model_type)
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Batch prediction failed, falling back to single requests: %s", e)
+    
+    return list(await asyncio.gather(
+        *[predict_sentiment_async(t, model_type, client=client) for t in texts]
+    ))
+
+def predict_sentiment_batch(texts, model_type=None):
+    """
+    Get sentiment predictions for several texts in one request.
+    
+    Uses the model API batch endpoint for the models it serves (synthetic,
+    twitter, hybrid). Other models, the default (model_type=None) and an
+    unavailable endpoint fall back to concurrent single predictions, so
+    results match predict_sentiment.
+    
+    The fallback runs its own event loop, so this must not be called from
+    a running one (it raises RuntimeError); use predict_sentiment_batch_async
+    from async code.
+    
+    Args:
+        texts (list): Texts to analyze
+        model_type (str, optional): Type of model to use
+        
+    Returns:
+        list: Prediction results in the same order as texts
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    
+    # Other models (and the default) would be answered by a different model, so use single calls
+    if model_type in _BATCH_MODELS:
+        try:
+            response = _SESSION.post(
+                _BATCH_URL,
+                data=orjson.dumps(_batch_payload(texts, model_type))
+            )
+            response.raise_for_status()
+            predictions = _unpack_batch_result(_decode_json(response), texts, model_type)
+            logger.info("Received batch prediction for %d texts", len(predictions))
+            return predictions
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning("Batch prediction failed, falling back to single requests: %s", e)
+    
+    return predict_sentiment_many(texts, model_type)
+
+class _PredictionCoalescer:
+    """
+    Groups concurrent scalar prediction requests into batch requests.
+    
+    Requests are collected until max_batch items are queued or max_wait
+    seconds have passed since the first one, then sent together per model.
+    """
+    
+    def __init__(self, max_batch=32, max_wait=0.02):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._loop = None
+        self._queue = None
+        self._worker = None
+        self._flushes = set()
+    
+    async def submit(self, text, model_type=None):
+        """
+        Queue a text for prediction and wait for its result.
+        
+        Args:
+            text (str): Text to analyze
+            model_type (str, optional): Type of model to use
+            
+        Returns:
+            dict: Prediction result
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queues and futures are bound to a loop, so start over on a new one
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+            self._flushes = set()
+        
+        future = loop.create_future()
+        self._queue.put_nowait((text, model_type, future))
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._drain())
+        return await future
+    
+    async def _drain(self):
+        """Start a batch request per collected batch until the queue is empty."""
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            groups = {}
+            for text, model_type, future in batch:
+                groups.setdefault(model_type, []).append((text, future))
+            # Don't wait for the response, so the next batch can be collected meanwhile
+            for model_type, items in groups.items():
+                task = loop.create_task(self._flush(model_type, items))
+                self._flushes.add(task)
+                task.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self, model_type, items):
+        """Send one batch request and resolve the waiting futures."""
+        try:
+            results = await predict_sentiment_batch_async([text for text, _ in items], model_type)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+_COALESCER = _PredictionCoalescer()
+
+async def predict_sentiment_coalesced(text, model_type=None):
+    """
+    Get a sentiment prediction, batching it with other concurrent requests.
+    
+    Batches are sent as predict_sentiment_batch_async calls, so the result
+    matches predict_sentiment; only synthetic, twitter and hybrid requests
+    are actually combined into one request.
+    
+    Args:
+        text (str): Text to analyze
+        model_type (str, optional): Type of model to use
+        
+    Returns:
+        dict: Prediction result
+    """
+    return await _COALESCER.submit(text, model_type)
+
 def get_sentiment_over_time(days=30):
     """
     Get sentiment trends over time.
@@ -243,33 +926,27 @@ def get_sentiment_over_time(days=30):
     Returns:
         pandas.DataFrame: DataFrame with daily sentiment counts
     """
+    import pandas as pd
+    
     try:
-        # Get incidents from database
-        df = get_incidents_from_db(limit=1000)
+        # Get incidents in the date range from the database
+        start_date = datetime.now().date() - timedelta(days=days)
+        df = get_incidents_from_db(limit=None, start=datetime.combine(start_date, datetime.min.time()))
         
         if df.empty:
             return pd.DataFrame()
         
-        # Filter for date range
-        start_date = datetime.now().date() - timedelta(days=days)
-        df = df[df['date'] >= start_date]
-        
-        # Group by date and sentiment
-        sentiment_over_time = df.groupby(['date', 'sentiment_label']).size().reset_index(name='count')
-        
-        # Pivot table for easier plotting
-        pivot_table = sentiment_over_time.pivot(
-            index='date', 
-            columns='sentiment_label', 
-            values='count'
-        ).fillna(0)
-        
-        # Ensure all sentiment labels exist
-        for label in ['positive', 'neutral', 'negative', 'not analyzed']:
-            if label not in pivot_table.columns:
-                pivot_table[label] = 0
+        # Count incidents per date and sentiment, ensuring all sentiment labels exist
+        counts = df.value_counts(['date', 'sentiment_label'])
+        pivot_table = counts.unstack(fill_value=0).reindex(
+            columns=_SENTIMENT_LABELS,
+            fill_value=0
+        )
         
-        pivot_table = pivot_table.reset_index()
+        # Make sure every day in the range is represented, including days without incidents
+        last_date = max(pd.Timestamp(datetime.now().date()), pivot_table.index.max())
+        all_dates = pd.date_range(start_date, last_date, freq='D', name='date')
+        pivot_table = pivot_table.reindex(all_dates, fill_value=0).reset_index()
         logger.info(f"Generated sentiment trends over {days} days")
         return pivot_table
     
@@ -287,17 +964,17 @@ def get_recent_incidents(limit=10):
     Returns:
         pandas.DataFrame: DataFrame with recent incidents
     """
+    import pandas as pd
+    
     try:
-        df = get_incidents_from_db(limit=limit)
+        # The database returns the most recent incidents first
+        df = get_incidents_from_db(limit=limit, order_by='timestamp DESC')
         
         if df.empty:
             return pd.DataFrame()
         
-        # Sort by timestamp (most recent first)
-        df = df.sort_values('timestamp', ascending=False).head(limit)
-        
-        # Format timestamp for display
-        df['formatted_time'] = df['timestamp'].dt.strftime('%Y-%m-%d %H:%M')
+        # Format timestamp for display as 'YYYY-MM-DD HH:MM'
+        df['formatted_time'] = df['timestamp'].dt.floor('min').astype(str).str[:16]
         
         return df
     
@@ -316,6 +993,9 @@ def get_sentiment_by_day_of_month(month=None, year=None):
     Returns:
         pandas.DataFrame: DataFrame with daily sentiment counts for the month
     """
+    import numpy as np
+    import pandas as pd
+    
     try:
         # Set defaults to current month/year if not provided
         if month is None:
@@ -323,54 +1003,56 @@ def get_sentiment_by_day_of_month(month=None, year=None):
         if year is None:
             year = datetime.now().year
             
-        # Get incidents from database (generous limit to ensure we get all data)
-        df = get_incidents_from_db(limit=10000)
-        
-        if df.empty:
-            return pd.DataFrame()
-        
-        # Filter for the specific month and year
-        df = df[(df['timestamp'].dt.month == month) & (df['timestamp'].dt.year == year)]
+        # Get incidents for the specific month and year from the database
+        month_start = datetime(year, month, 1)
+        month_end = datetime(year + month // 12, month % 12 + 1, 1)
+        df = get_incidents_from_db(limit=None, start=month_start, end=month_end, include_date=False)
         
         if df.empty:
             logger.warning(f"No data found for {year}-{month}")
             # Create empty DataFrame with expected structure for consistent return
             return pd.DataFrame(columns=['day', 'positive', 'neutral', 'negative'])
         
-        # Extract day of month
-        df['day'] = df['timestamp'].dt.day
-        
-        # Group by day and sentiment
-        daily_sentiment = df.groupby(['day', 'sentiment_label']).size().reset_index(name='count')
-        
-        # Pivot table for easier plotting
-        pivot_table = daily_sentiment.pivot(
-            index='day', 
-            columns='sentiment_label', 
-            values='count'
-        ).fillna(0)
+        # Day of month from the offset to the month start, in one NumPy operation
+        day = (df['timestamp'].values - np.datetime64(month_start)).astype('timedelta64[D]').astype(int) + 1
         
-        # Ensure all sentiment labels exist
-        for label in ['positive', 'neutral', 'negative']:
-            if label not in pivot_table.columns:
-                pivot_table[label] = 0
-        
-        # Keep only the sentiment columns we need
-        pivot_table = pivot_table[['positive', 'neutral', 'negative']]
-        
-        # Reset index to make 'day' a column
-        pivot_table = pivot_table.reset_index()
+        # Count incidents per day and sentiment, keeping only the sentiment columns we need
+        counts = df.assign(day=day).value_counts(['day', 'sentiment_label'])
+        pivot_table = counts.unstack(fill_value=0).reindex(
+            columns=['positive', 'neutral', 'negative'],
+            fill_value=0
+        )
         
         # Make sure all days of month are represented (1-31 or appropriate for month)
-        days_in_month = (datetime(year, month % 12 + 1, 1) - timedelta(days=1)).day if month < 12 else 31
-        all_days = pd.DataFrame({'day': range(1, days_in_month + 1)})
-        
-        # Merge to ensure all days are included
-        result = pd.merge(all_days, pivot_table, on='day', how='left').fillna(0)
+        days_in_month = monthrange(year, month)[1]
+        all_days = pd.RangeIndex(1, days_in_month + 1, name='day')
+        result = pivot_table.reindex(all_days, fill_value=0).reset_index()
         
         logger.info(f"Generated daily sentiment trends for {year}-{month}")
         return result
     
     except Exception as e:
         logger.error(f"Error generating daily sentiment trends: {str(e)}")
-        return pd.DataFrame(columns=['day', 'positive', 'neutral', 'negative']) 
\ No newline at end of file
+        return pd.DataFrame(columns=['day', 'positive', 'neutral', 'negative']) 
+
+def dashboard_snapshot(days=30, recent_limit=10):
+    """
+    Fetch the main dashboard datasets concurrently.
+    
+    Each query waits on its own database connection, so running them in
+    threads overlaps their I/O.
+    
+    Args:
+        days (int): Number of days to include in the sentiment trends
+        recent_limit (int): Maximum number of recent incidents to retrieve
+        
+    Returns:
+        dict: 'stats', 'trend' and 'recent' results
+    """
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            'stats': executor.submit(get_sentiment_statistics),
+            'trend': executor.submit(get_sentiment_over_time, days),
+            'recent': executor.submit(get_recent_incidents, recent_limit)
+        }
+        return {name: future.result() for name, future in futures.items()}
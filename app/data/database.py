@@ -19,6 +19,12 @@ logger = logging.getLogger('database')
 current_dir = Path(__file__).resolve().parent
 DB_PATH = os.path.join(current_dir, 'incidents.db')
 
+# Allowed orderings for incident queries, mapped to their SQL clause
+INCIDENT_ORDERINGS = {
+    'timestamp DESC': 'i.timestamp DESC',
+    'timestamp ASC': 'i.timestamp ASC'
+}
+
 def get_db_connection():
     """
     Create a connection to the SQLite database.
@@ -48,6 +54,11 @@ def init_db():
         )
         ''')
         
+        # Index timestamps for ordered and date-range incident queries
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_incidents_timestamp ON incidents (timestamp)
+        ''')
+        
         # Create sentiment table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS sentiment (
@@ -103,29 +114,52 @@ def save_incidents(incidents):
     finally:
         conn.close()
 
-def get_incidents(limit=100, offset=0):
+def get_incidents(limit=100, offset=0, start=None, end=None, order_by='timestamp DESC'):
     """
     Retrieve incidents from the database.
     
     Args:
-        limit (int): Maximum number of incidents to retrieve
+        limit (int, optional): Maximum number of incidents to retrieve, None for no limit
         offset (int): Number of incidents to skip
+        start (datetime, optional): Only include incidents at or after this time (UTC)
+        end (datetime, optional): Only include incidents before this time (UTC)
+        order_by (str): One of INCIDENT_ORDERINGS
         
     Returns:
         list: List of incident dictionaries
     """
+    if order_by not in INCIDENT_ORDERINGS:
+        logger.error(f"Unsupported incident ordering: {order_by}")
+        return []
+    
     conn = get_db_connection()
     try:
         cursor = conn.cursor()
+        
+        # Timestamps are stored as ISO 8601 strings, so bounds compare lexically
+        conditions = []
+        params = []
+        if start is not None:
+            conditions.append("i.timestamp >= ?")
+            params.append(start.strftime("%Y-%m-%dT%H:%M:%S"))
+        if end is not None:
+            conditions.append("i.timestamp < ?")
+            params.append(end.strftime("%Y-%m-%dT%H:%M:%S"))
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        # SQLite treats a negative LIMIT as no limit
+        params.extend([-1 if limit is None else limit, offset])
+        
         cursor.execute(
-            """
+            f"""
             SELECT i.id, i.report, i.timestamp, s.sentiment
             FROM incidents i
             LEFT JOIN sentiment s ON i.id = s.incident_id
-            ORDER BY i.timestamp DESC
+            {where_clause}
+            ORDER BY {INCIDENT_ORDERINGS[order_by]}
             LIMIT ? OFFSET ?
             """,
-            (limit, offset)
+            params
         )
         
         incidents = []